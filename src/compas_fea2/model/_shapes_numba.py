@@ -0,0 +1,47 @@
+"""Optional Numba kernels for :mod:`compas_fea2.model.shapes`.
+
+If Numba is not installed, ``shoelace_props`` is ``None`` and the shapes
+fall back to the NumPy implementation.
+"""
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _shoelace_props(x, y):
+    """Signed area, centroid and centroidal moments of a closed polygon.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Coordinates of the vertices, without repeating the first one.
+
+    Returns
+    -------
+    tuple(float)
+        A, cx, cy, Ixx, Iyy, Ixy. The area and the moments are negative
+        for clockwise polygons.
+
+    """
+    n = x.shape[0]
+    A = cx = cy = Ixx = Iyy = Ixy = 0.0
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        xi, yi, xj, yj = x[i], y[i], x[j], y[j]
+        a = xi * yj - xj * yi
+        A += a
+        cx += (xi + xj) * a
+        cy += (yi + yj) * a
+        Ixx += (yi * yi + yi * yj + yj * yj) * a
+        Iyy += (xi * xi + xi * xj + xj * xj) * a
+        Ixy += (xi * yj + 2 * xi * yi + 2 * xj * yj + xj * yi) * a
+    A *= 0.5
+    cx /= 6 * A
+    cy /= 6 * A
+    return A, cx, cy, Ixx / 12 - A * cy * cy, Iyy / 12 - A * cx * cx, Ixy / 24 - A * cx * cy
+
+
+# the plain Python loop above is what gets compiled, so it can be tested without Numba
+shoelace_props = numba.njit(cache=True, fastmath=True)(_shoelace_props) if numba is not None else None
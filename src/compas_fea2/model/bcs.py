@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from types import MappingProxyType
+
 from compas_fea2.base import FEAData
 
 docs = """
@@ -58,6 +60,7 @@ class _BoundaryCondition(FEAData):
         self._xx = False
         self._yy = False
         self._zz = False
+        self._components = None
 
     @property
     def x(self):
@@ -93,7 +96,16 @@ class _BoundaryCondition(FEAData):
 
     @property
     def components(self):
-        return {c: getattr(self, c) for c in ["x", "y", "z", "xx", "yy", "zz"]}
+        # the flags are fixed by the constructors, so the view is built once
+        if self._components is None:
+            self._components = MappingProxyType({"x": self._x, "y": self._y, "z": self._z, "xx": self._xx, "yy": self._yy, "zz": self._zz})
+        return self._components
+
+    def __getstate__(self):
+        # mappingproxy cannot be pickled: it is built again on request
+        state = self.__dict__.copy()
+        state["_components"] = None
+        return state
 
 
 class GeneralBC(_BoundaryCondition):
@@ -29,6 +29,7 @@ from compas_fea2.model.ics import _InitialCondition
 from compas_fea2.model.nodes import Node
 from compas_fea2.model.parts import RigidPart
 from compas_fea2.model.parts import _Part
+from compas_fea2.model.parts import _closest_nodes
 from compas_fea2.model.connectors import Connector
 from compas_fea2.utilities._utils import get_docstring
 from compas_fea2.utilities._utils import part_method
@@ -425,6 +426,11 @@ class Model(FEAData):
     def find_closest_nodes_to_point(self, point, distance, number_of_nodes=1, plane=None):
         pass
 
+    @get_docstring(_Part)
+    def find_closest_nodes_to_points(self, points, distance, plane=None):
+        # the closest node must be searched across all the parts at once
+        return _closest_nodes(self.find_nodes_on_plane(plane) if plane else self.nodes, points, distance)
+
     @get_docstring(_Part)
     @part_method
     def find_nodes_around_node(self, node, distance):
@@ -5,6 +5,7 @@ from __future__ import print_function
 from math import sqrt
 from math import pi
 
+import numpy as np
 from compas.geometry import Box
 from compas.geometry import Frame
 from compas.geometry import Plane
@@ -18,6 +19,7 @@ from compas.geometry import distance_point_point_sqrd
 from compas.geometry import is_point_in_polygon_xy
 from compas.geometry import is_point_on_plane
 from compas.tolerance import TOL
+from scipy.spatial import cKDTree
 
 import compas_fea2
 from compas_fea2.base import FEAData
@@ -36,12 +38,25 @@ from .groups import FacesGroup
 from .groups import NodesGroup
 from .materials.material import _Material
 from .nodes import Node
+from .releases import _LOCATIONS
 from .releases import _BeamEndRelease
 from .sections import ShellSection
 from .sections import SolidSection
 from .sections import _Section
 
-import timeit
+
+def _closest_nodes(nodes, points, distance):
+    """Closest of `nodes` to each of `points`, or None if it is farther than
+    `distance`, found with a single KD-tree query."""
+    nodes = list(nodes)
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    if not nodes:
+        return [None] * len(points)
+    tree = cKDTree(np.array([node.xyz for node in nodes], dtype=float))
+    # points without a node within `distance` get the index len(nodes)
+    _, closest = tree.query(points, distance_upper_bound=distance)
+    return [nodes[i] if i < len(nodes) else None for i in closest.tolist()]
+
 
 class _Part(FEAData):
     """Base class for Parts.
@@ -618,6 +633,31 @@ class _Part(FEAData):
             number_of_nodes = len(nodes)
         return [k for k, v in sorted(nodes.items(), key=lambda item: item[1])][:number_of_nodes]
 
+    def find_closest_nodes_to_points(self, points, distance, plane=None):
+        # type: (list[Point], float, Plane) -> list[Node]
+        """Find the closest node to each of several geometrical locations.
+
+        All the locations are queried at once, instead of searching the nodes
+        of the part once per location.
+
+        Parameters
+        ----------
+        points : list[:class:`compas.geometry.Point`]
+            The geometrical locations.
+        distance : float
+            Maximum distance from each location.
+        plane : :class:`compas.geometry.Plane`, optional
+            Limit the search to one plane.
+
+        Returns
+        -------
+        list[:class:`compas_fea2.model.Node`]
+            The closest node to each location, or None if there are no nodes
+            within `distance` from it.
+
+        """
+        return _closest_nodes(self.find_nodes_on_plane(plane) if plane else self.nodes, points, distance)
+
     def find_nodes_around_node(self, node, distance, plane=None):
         # type: (Node, float, Plane) -> list[Node]
         """Find all nodes around a given node (excluding the node itself).
@@ -1374,6 +1414,13 @@ class DeformablePart(_Part):
         The sections belonging to the part.
     releases : Set[:class:`compas_fea2.model._BeamEndRelease`]
         The releases belonging to the part.
+    release_assignments : list
+        The `(element, location, release)` assignments of the releases of the
+        part, including those of the shared releases.
+    releases_arrays : dict
+        The release assignments of the part as arrays: `flags` (packed release
+        flags), `location` (0 for 'start', 1 for 'end') and `element` (element
+        key), built from `release_assignments` when requested.
 
     """
 
@@ -1382,6 +1429,7 @@ class DeformablePart(_Part):
         self._materials = set()
         self._sections = set()
         self._releases = set()
+        self._release_assignments = []
 
     @property
     def materials(self):
@@ -1395,6 +1443,22 @@ class DeformablePart(_Part):
     def releases(self):
         return self._releases
 
+    @property
+    def release_assignments(self):
+        return self._release_assignments
+
+    @property
+    def releases_arrays(self):
+        # built on request, so that the element keys are the current ones
+        for element, _, _ in self._release_assignments:
+            if element._registration is not self:
+                raise ValueError("{!r} is released but does not belong to {!r}.".format(element, self))
+        return {
+            "flags": np.array([release.flags for _, _, release in self._release_assignments], dtype=np.uint8),
+            "location": np.array([_LOCATIONS.index(location) for _, location, _ in self._release_assignments], dtype=np.uint8),
+            "element": np.array([element.key for element, _, _ in self._release_assignments], dtype=np.int64),
+        }
+
     # =========================================================================
     #                       Constructor methods
     # =========================================================================
@@ -1626,9 +1690,17 @@ class DeformablePart(_Part):
         """
         if not isinstance(release, _BeamEndRelease):
             raise TypeError("{!r} is not a beam release element.".format(release))
-        release.element = element
-        release.location = location
+        if release._shared:
+            # shared releases are not bound to an element: the part keeps the assignment
+            if not isinstance(element, BeamElement):
+                raise TypeError("{!r} is not a beam element.".format(element))
+            if location not in _LOCATIONS:
+                raise TypeError("the location can be either `start` or `end`")
+        else:
+            release.element = element
+            release.location = location
         self._releases.add(release)
+        self._release_assignments.append((element, location, release))
         return release
 
 
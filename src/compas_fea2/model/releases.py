@@ -2,9 +2,25 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from functools import lru_cache
+
 import compas_fea2.model
 from compas_fea2.base import FEAData
 
+# order of the bits in the packed release flags
+_RELEASE_DOFS = ("n", "v1", "v2", "m1", "m2", "t")
+# index of each location in the packed release locations
+_LOCATIONS = ("start", "end")
+_VALID_LOCATIONS = frozenset(_LOCATIONS)
+
+
+@lru_cache(maxsize=128)
+def _shared_release(cls, flags):
+    values = dict(zip(_RELEASE_DOFS, flags))
+    release = cls(**{dof: values[dof] for dof in cls._dofs})
+    release._shared = True
+    return release
+
 
 class _BeamEndRelease(FEAData):
     """Assign a general end release to a `compas_fea2.model.BeamElement`.
@@ -45,6 +61,11 @@ class _BeamEndRelease(FEAData):
 
     """
 
+    # release flags accepted by the constructor, in positional order
+    _dofs = _RELEASE_DOFS
+    # True for the instances shared through `get`
+    _shared = False
+
     def __init__(self, n=False, v1=False, v2=False, m1=False, m2=False, t=False, **kwargs):
         super(_BeamEndRelease, self).__init__(**kwargs)
 
@@ -57,6 +78,47 @@ class _BeamEndRelease(FEAData):
         self.m2 = m2
         self.t = t
 
+    @classmethod
+    def get(cls, *args, **kwargs):
+        """Get a shared release with the given release flags.
+
+        Releases with the same flags are created only once and then reused,
+        which saves memory in models where a handful of release types is
+        applied to many elements.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The release flags, as for the class constructor.
+
+        Returns
+        -------
+        :class:`compas_fea2.model._BeamEndRelease`
+            The shared release.
+
+        Raises
+        ------
+        TypeError
+            If an argument is not a release flag of the class.
+
+        Notes
+        -----
+        The returned instance is shared by all the callers asking for the same
+        flags: treat it as immutable. It is not bound to any element: the
+        assignments made through :meth:`compas_fea2.model.DeformablePart.add_beam_release`
+        are stored by the part, see `release_assignments`.
+
+        """
+        if len(args) > len(cls._dofs):
+            raise TypeError("{} takes at most {} release flags".format(cls.__name__, len(cls._dofs)))
+        flags = dict(zip(cls._dofs, args))
+        for dof, value in kwargs.items():
+            if dof not in cls._dofs or dof in flags:
+                raise TypeError("{!r} is not a release flag of {} or is given twice".format(dof, cls.__name__))
+            flags[dof] = value
+        # normalised key, so that equivalent calls get the same instance
+        return _shared_release(cls, tuple(bool(flags.get(dof, False)) for dof in _RELEASE_DOFS))
+
     @property
     def element(self):
         return self._element
@@ -73,10 +135,15 @@ class _BeamEndRelease(FEAData):
 
     @location.setter
     def location(self, value):
-        if value not in ("start", "end"):
+        if value not in _VALID_LOCATIONS:
             raise TypeError("the location can be either `start` or `end`")
         self._location = value
 
+    @property
+    def flags(self):
+        """int : The release flags packed in a bitmask (bit 0 `n`, 1 `v1`, 2 `v2`, 3 `m1`, 4 `m2`, 5 `t`)."""
+        return sum(1 << i for i, dof in enumerate(_RELEASE_DOFS) if getattr(self, dof))
+
 
 class BeamEndPinRelease(_BeamEndRelease):
     """Assign a pin end release to a `compas_fea2.model.BeamElement`.
@@ -92,6 +159,8 @@ class BeamEndPinRelease(_BeamEndRelease):
 
     """
 
+    _dofs = ("m1", "m2", "t")
+
     def __init__(self, m1=False, m2=False, t=False, **kwargs):
         super(BeamEndPinRelease, self).__init__(n=False, v1=False, v2=False, m1=m1, m2=m2, t=t, **kwargs)
 
@@ -108,5 +177,7 @@ class BeamEndSliderRelease(_BeamEndRelease):
 
     """
 
+    _dofs = ("v1", "v2")
+
     def __init__(self, v1=False, v2=False, **kwargs):
         super(BeamEndSliderRelease, self).__init__(v1=v1, v2=v2, n=False, m1=False, m2=False, t=False, **kwargs)
@@ -4,20 +4,143 @@ from compas.geometry import Frame, Plane
 from compas.geometry import Translation
 from compas.geometry import Transformation
 from compas.datastructures import Mesh
+from compas.tolerance import TOL
 from compas_fea2.base import DimensionlessMeta
 from compas_fea2.base import FEAData
+from compas_fea2.model._shapes_numba import shoelace_props as _shoelace_props_jit
 
 import numpy as np
-from math import degrees, sqrt, atan2, pi
+from functools import cached_property
+from functools import lru_cache
+from math import degrees, sqrt, atan2, hypot, pi
+
+
+def _regular_polygon_points(n, rx, ry=None, offset=0.0):
+    """Compute the points of a regular polygon (or of a polygonal ellipse) in the XY plane.
+
+    Parameters
+    ----------
+    n : int
+        Number of points.
+    rx : float
+        Radius along the x axis.
+    ry : float, optional
+        Radius along the y axis, by default equal to `rx`.
+    offset : float, optional
+        Angle (in radians) of the first point, by default 0.
+
+    Returns
+    -------
+    list[:class:`compas.geometry.Point`]
+
+    """
+    thetas = np.linspace(offset, offset + 2 * np.pi, n, endpoint=False)
+    xs = rx * np.cos(thetas)
+    ys = (rx if ry is None else ry) * np.sin(thetas)
+    return [Point(float(x), float(y), 0.0) for x, y in zip(xs, ys)]
+
+
+def _are_coplanar(points, rtol=None, atol=None):
+    """Check coplanarity from the singular values of the centred coordinates.
+
+    The smallest singular value must be within ``atol + rtol * s_max`` of zero,
+    as in :meth:`compas.tolerance.Tolerance.is_close`, with the tolerances of
+    the global :obj:`compas.tolerance.TOL` by default.
+    """
+    rtol = rtol or TOL.relative
+    atol = atol or TOL.absolute
+    pts = np.asarray([[p[0], p[1], p[2]] for p in points], dtype=np.float64)
+    if len(pts) < 4:
+        return True
+    s = np.linalg.svd(pts - pts.mean(axis=0), compute_uv=False)
+    return bool(s[2] <= atol + rtol * s[0])
+
+
+def _shoelace_props(x, y):
+    """Signed area, centroid and centroidal moments of a closed polygon.
+
+    NumPy version of the Numba kernel in :mod:`compas_fea2.model._shapes_numba`.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Coordinates of the vertices, with the first one repeated at the end.
+
+    Returns
+    -------
+    tuple(float)
+        A, cx, cy, Ixx, Iyy, Ixy. The area and the moments are negative
+        for clockwise polygons.
+
+    """
+    # vertex i and its successor are plain slice views of the closed arrays
+    x, xj = x[:-1], x[1:]
+    y, yj = y[:-1], y[1:]
+    a = x * yj - xj * y
+    # all the weighted sums in a single matrix-vector product
+    terms = np.stack(
+        [
+            np.ones_like(a),
+            x + xj,
+            y + yj,
+            y * y + y * yj + yj * yj,
+            x * x + x * xj + xj * xj,
+            x * yj + 2 * x * y + 2 * xj * yj + xj * y,
+        ]
+    )
+    two_A, sx, sy, sxx, syy, sxy = terms @ a
+    A = 0.5 * two_A
+    cx = sx / (6 * A)
+    cy = sy / (6 * A)
+    return A, cx, cy, sxx / 12 - A * cy**2, syy / 12 - A * cx**2, sxy / 24 - A * cx * cy
+
+
+@lru_cache(maxsize=4096)
+def _rect_torsion_J(l1, l2):
+    """Saint-Venant torsion constant of a solid rectangle with sides `l1` >= `l2`."""
+    r = l2 / l1
+    return l1 * l2**3 * (1 / 3 - 0.21 * r * (1 - r**4 / 12))
+
+
+def _section_props(A, cx, cy, Ixx, Iyy, Ixy):
+    """Pack the section properties as returned by :meth:`Shape._compute_section_props`."""
+    return {"A": A, "cx": cx, "cy": cy, "Ixx": Ixx, "Iyy": Iyy, "Ixy": Ixy}
+
+
+def _regular_polygon_props(n, circumradius):
+    """Closed-form section properties of a regular polygon centred at the origin."""
+    A = 0.5 * n * circumradius**2 * np.sin(2 * np.pi / n)
+    side = 2 * circumradius * np.sin(np.pi / n)
+    inertia = A * (6 * circumradius**2 - side**2) / 24
+    return _section_props(float(A), 0.0, 0.0, float(inertia), float(inertia), 0.0)
 
 
 class Shape(Polygon, FEAData):
+    # geometric properties memoised on first access and reset when the points change
+    _CACHED_PROPERTIES = (
+        "_T",
+        "_T_inv",
+        "_T_matrix",
+        "_coords",
+        "_section_props",
+        "_xy",
+        "points_xy",
+        "_xy_closed",
+        "area",
+        "centroid_xy",
+        "centroid",
+        "inertia_xy",
+        "radii",
+        "principal",
+        "principal_radii",
+    )
+
+    # built-in shapes generate their own points on the XY plane
+    _points_are_planar_by_construction = False
+
     def __init__(self, points, frame=None):
         super().__init__(points)
-        if not self.is_planar:
-            raise ValueError("The points mast belong to the same plane")
         self._frame = frame or Frame.worldXY()
-        self._T = Transformation.from_frame_to_frame(self._frame, Frame.worldXY())
         self._J = None
         self._g0 = None
         self._gw = None
@@ -31,42 +154,93 @@ class Shape(Polygon, FEAData):
     number of edges:    {len(self._points)}  # Assuming closed shapes where number of edges = number of points
         """
 
+    @cached_property
+    def _T(self):
+        """Transformation from the frame of the shape to world XY.
+
+        Built, together with the planarity check, only when a geometric
+        property is first requested.
+        """
+        if not self._points_are_planar_by_construction and not _are_coplanar(self._points):
+            raise ValueError("The points mast belong to the same plane")
+        return Transformation.from_frame_to_frame(self._frame, Frame.worldXY())
+
+    @cached_property
+    def _T_inv(self):
+        return self._T.inverted()
+
+    @cached_property
+    def _T_matrix(self):
+        return np.asarray(self._T.matrix, dtype=np.float64)
+
+    def _invalidate_cache(self):
+        """Reset the memoised geometric properties."""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
     # ==========================================================================
     # Properties
     # ==========================================================================
     @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        Polygon.points.fset(self, points)
+        self._invalidate_cache()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate_cache()
+
+    @cached_property
+    def _coords(self):
+        """numpy.ndarray : (n, 3) global coordinates of the points."""
+        return np.array([[p[0], p[1], p[2]] for p in self._points], dtype=np.float64)
+
+    @cached_property
+    def _xy(self):
+        """numpy.ndarray : (n, 3) coordinates of the points in the local frame of the shape."""
+        return self._coords @ self._T_matrix[:3, :3].T + self._T_matrix[:3, 3]
+
+    @cached_property
     def points_xy(self):
-        return [p.transformed(self._T) for p in self.points]
+        return [Point(*xyz) for xyz in self._xy.tolist()]
 
     @property
     def A(self):
         return self.area
 
-    @property
+    @cached_property
+    def area(self):
+        """float : area of the shape."""
+        return self._section_props["A"]
+
+    @cached_property
     def centroid_xy(self):
         """Compute the centroid."""
-        sx = sy = 0
-        x, y = self.xy_arrays
-        n = len(self.points_xy)
-        for i in range(n):
-            j = (i + 1) % n  # Ensure the loop wraps around to the first point
-            common_factor = x[i] * y[j] - x[j] * y[i]
-            sx += (x[i] + x[j]) * common_factor
-            sy += (y[i] + y[j]) * common_factor
-        factor = 1 / (6 * self.area)
-        return Point(sx * factor, sy * factor, 0.0)
+        props = self._section_props
+        return Point(props["cx"], props["cy"], 0.0)
+
+    @cached_property
+    def _xy_closed(self):
+        """numpy.ndarray : read-only (2, n + 1) local x and y coordinates, first point repeated at the end."""
+        n = len(self._xy)
+        closed = np.empty((2, n + 1), dtype=np.float64)
+        closed[:, :n] = self._xy[:, :2].T
+        closed[:, n] = closed[:, 0]
+        closed.flags.writeable = False
+        return closed
 
     @property
     def xy_arrays(self):
-        x = [c[0] for c in self.points_xy]
-        x.append(self.points_xy[0][0])
-        y = [c[1] for c in self.points_xy]
-        y.append(self.points_xy[0][1])
-        return x, y
+        """tuple(numpy.ndarray) : read-only views of the closed local x and y coordinates."""
+        return self._xy_closed[0], self._xy_closed[1]
 
-    @property
+    @cached_property
     def centroid(self):
-        return self.centroid_xy.transformed(self._T.inverted())
+        return self.centroid_xy.transformed(self._T_inv)
 
     @property
     def frame(self):
@@ -76,7 +250,7 @@ class Shape(Polygon, FEAData):
     @property
     def Ixx(self):
         """float : moment of inertia about the x axis parallel to the global X axis and passing through the centroid."""
-        return self.inertia_xy[0]
+        return self._section_props["Ixx"]
 
     @property
     def rx(self):
@@ -89,7 +263,7 @@ class Shape(Polygon, FEAData):
     @property
     def Iyy(self):
         """float : moment of inertia about the y axis parallel to the global Y axis and passing through the centroid."""
-        return self.inertia_xy[1]
+        return self._section_props["Iyy"]
 
     @property
     def ry(self):
@@ -101,12 +275,12 @@ class Shape(Polygon, FEAData):
     @property
     def Ixy(self):
         """float : product of inertia w.r.t. the x and y axes"""
-        self.inertia_xy[2]
+        return self._section_props["Ixy"]
 
     @property
     def I1(self):
         """float : first principal moment of inertia."""
-        return self.principal[1]
+        return self.principal[0]
 
     @property
     def r1(self):
@@ -116,7 +290,7 @@ class Shape(Polygon, FEAData):
     @property
     def I2(self):
         """float : second principal moment of inertia."""
-        return self.principal[2]
+        return self.principal[1]
 
     @property
     def r2(self):
@@ -126,7 +300,7 @@ class Shape(Polygon, FEAData):
     @property
     def theta(self):
         """float : angle (in radians) between the first principal inertia axis ant the x axis."""
-        return self.principal[3]
+        return self.principal[2]
 
     @property
     def Avx(self):
@@ -153,38 +327,49 @@ class Shape(Polygon, FEAData):
     # Methods
     # ==========================================================================
 
-    @property
+    def _compute_section_props(self):
+        """Compute area, centroid and moments of inertia with the shoelace formula.
+
+        Returns
+        -------
+        dict
+            Area `A`, centroid `cx`, `cy` and moments and product of inertia about
+            the centroid `Ixx`, `Iyy`, `Ixy`, in the local frame of the shape.
+
+        """
+        if _shoelace_props_jit is not None:
+            xy = np.ascontiguousarray(self._xy[:, :2].T)
+            A, cx, cy, Ixx, Iyy, Ixy = _shoelace_props_jit(xy[0], xy[1])
+        else:
+            A, cx, cy, Ixx, Iyy, Ixy = _shoelace_props(*self.xy_arrays)
+        if A < 0:
+            # clockwise points: flip the sign of the signed integrals
+            A, Ixx, Iyy, Ixy = -A, -Ixx, -Iyy, -Ixy
+        return _section_props(float(A), float(cx), float(cy), float(Ixx), float(Iyy), float(Ixy))
+
+    @cached_property
+    def _section_props(self):
+        return self._compute_section_props()
+
+    @cached_property
     def inertia_xy(self):
         """Compute the moments and product of inertia about the centroid."""
-        x, y = self.xy_arrays
-        n = len(self.points)
-        sum_x = sum_y = sum_xy = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            a = x[i] * y[j] - x[j] * y[i]
-            sum_x += (y[i] ** 2 + y[i] * y[j] + y[j] ** 2) * a
-            sum_y += (x[i] ** 2 + x[i] * x[j] + x[j] ** 2) * a
-            sum_xy += (x[i] * y[j] + 2 * x[i] * y[i] + 2 * x[j] * y[j] + x[j] * y[i]) * a
-        area = self.area
-        centroid_x, centroid_y, _ = self.centroid_xy
-        factor = 1 / 12
-        return (sum_x * factor - area * centroid_y**2,
-                sum_y * factor - area * centroid_x**2,
-                sum_xy / 24 - area * centroid_x * centroid_y)
+        props = self._section_props
+        return props["Ixx"], props["Iyy"], props["Ixy"]
 
-    @property
+    @cached_property
     def radii(self):
         """Compute the radii of inertia."""
         Ixx, Iyy, _ = self.inertia_xy
         return sqrt(Ixx / self.area), sqrt(Iyy / self.area)
 
-    @property
+    @cached_property
     def principal_radii(self):
         """Compute the radii of inertia."""
-        I1, I2, _ = self.inertia_xy
-        return sqrt(I1/ self.area), sqrt(I2 / self.area)
+        I1, I2, _ = self.principal
+        return sqrt(I1 / self.area), sqrt(I2 / self.area)
 
-    @property
+    @cached_property
     def principal(self):
         """Compute the principal moments of inertia and the orientation of the principal axes."""
         Ixx, Iyy, Ixy = self.inertia_xy
@@ -192,18 +377,22 @@ class Shape(Polygon, FEAData):
         diff = (Ixx - Iyy) / 2  # signed
         # theta = -atan(2*self.Jxy/(self.Jx - self.Jy))/2
         theta = atan2(-Ixy, diff) / 2
-        I1 = avg + sqrt(diff**2 + Ixy**2)
-        I2 = avg - sqrt(diff**2 + Ixy**2)
-        return I1, I2, theta
+        d = hypot(diff, Ixy)
+        return avg + d, avg - d, theta
+
+    def transform(self, transformation):
+        super().transform(transformation)
+        self._invalidate_cache()
 
     def translated(self, vector):
-        T = Translation.from_vector(vector)
-        frame = Frame.from_transformation(T)
-        return Shape([point.transformed(T) for point in self._points], frame)
+        frame = Frame.from_transformation(Translation.from_vector(vector))
+        coords = self._coords + np.asarray([vector[0], vector[1], vector[2]], dtype=np.float64)
+        return Shape([Point(*xyz) for xyz in coords.tolist()], frame)
 
     def oriented(self, frame):
-        T = Transformation.from_frame_to_frame(self._frame, frame)
-        return Shape([point.transformed(T) for point in self._points], frame)
+        M = np.asarray(Transformation.from_frame_to_frame(self._frame, frame).matrix, dtype=np.float64)
+        coords = self._coords @ M[:3, :3].T + M[:3, 3]
+        return Shape([Point(*xyz) for xyz in coords.tolist()], frame)
 
     # ==========================================================================
     # Reppresentation
@@ -211,48 +400,45 @@ class Shape(Polygon, FEAData):
 
     def summary(self):
         """Provide a text summary of cross-sectional properties."""
-        props = (self.area, self.centroid[0], self.centroid[1], self.Ixx, self.Iyy, self.Ixy, self.rx, self.ry, self.J1, self.J2, self.r1, self.r2, degrees(self.theta))
-        props = [round(prop, 2) for prop in props]
-
-        summ = """
+        return f"""
     Area
-    A       = {}
+    A       = {self.area:.2f}
 
     Centroid
-    cx      = {}
-    cy      = {}
+    cx      = {self.centroid[0]:.2f}
+    cy      = {self.centroid[1]:.2f}
 
     Moments and product of inertia about the centroid
-    Igx     = {}
-    Igy     = {}
-    Igxy    = {}
-    rx      = {}
-    ry      = {}
+    Igx     = {self.Ixx:.2f}
+    Igy     = {self.Iyy:.2f}
+    Igxy    = {self.Ixy:.2f}
+    rx      = {self.rx:.2f}
+    ry      = {self.ry:.2f}
 
     Principal moments of inertia about the centroid
-    I1      = {}
-    I2      = {}
-    r1      = {}
-    r2      = {}
-    θ︎       = {}°
-    """.format(
-            *props
-        )
-        return summ
+    I1      = {self.I1:.2f}
+    I2      = {self.I2:.2f}
+    r1      = {self.r1:.2f}
+    r2      = {self.r2:.2f}
+    θ︎       = {degrees(self.theta):.2f}°
+    """
 
 
 class Rectangle(Shape):
-    def __init__(self, w, h):
+    _points_are_planar_by_construction = True
+
+    def __init__(self, w, h, frame=None):
+        self._setup(w, h, frame)
+
+    def _setup(self, w, h, frame):
+        # shared by __init__ and from_arrays, which skips __init__
         self.__name__ = "Rectangle"
         self._w = w
         self._h = h
-        points = [Point(-self.w / 2, -self.h / 2.0, 0.0), Point(self.w / 2, -self.h / 2.0, 0.0), Point(self.w / 2, self.h / 2.0, 0.0), Point(-self.w / 2, self.h / 2.0, 0.0)]
-        super().__init__(points=points)
-        self._Avy = 0.833 * self.area
-        self._Avx = 0.833 * self.area
-        l1 = max([w, h])
-        l2 = min([w, h])
-        self._J = (l1 * l2**3) * (0.33333 - 0.21 * (l2 / l1) * (1 - (l2**4) / (l2 * l1**4)))
+        Shape.__init__(self, points=self._set_points(frame), frame=frame)
+        self._Avy = 0.833 * w * h
+        self._Avx = 0.833 * w * h
+        self._J = _rect_torsion_J(max(w, h), min(w, h))
         self._g0 = 0  # FIXME
         self._gw = 0  # FIXME
 
@@ -264,8 +450,65 @@ class Rectangle(Shape):
     def h(self):
         return self._h
 
+    @classmethod
+    def from_arrays(cls, w, h, frames=None):
+        """Create many rectangles at once, computing their section properties
+        in a single vectorised pass.
+
+        Parameters
+        ----------
+        w : list(float) | numpy.ndarray
+            Widths of the rectangles.
+        h : list(float) | numpy.ndarray
+            Heights of the rectangles.
+        frames : list(:class:`compas.geometry.Frame`), optional
+            Local frames of the rectangles, by default the world XY frame.
+
+        Returns
+        -------
+        list(:class:`compas_fea2.model.shapes.Rectangle`)
+
+        Raises
+        ------
+        ValueError
+            If `w`, `h` and `frames` do not have the same length.
+
+        """
+        w = np.asarray(w, dtype=np.float64)
+        h = np.asarray(h, dtype=np.float64)
+        if frames is None:
+            frames = [None] * len(w)
+        if not len(frames) == len(w) == len(h):
+            raise ValueError("w, h and frames must have the same length, got {}, {} and {}.".format(len(w), len(h), len(frames)))
+        A = w * h
+        Ixx = w * h**3 / 12
+        Iyy = h * w**3 / 12
+
+        shapes = []
+        for wi, hi, Ai, Ixxi, Iyyi, frame in zip(w.tolist(), h.tolist(), A.tolist(), Ixx.tolist(), Iyy.tolist(), frames):
+            shape = cls.__new__(cls)
+            shape._setup(wi, hi, frame)
+            shape.__dict__["_section_props"] = _section_props(Ai, 0.0, 0.0, Ixxi, Iyyi, 0.0)
+            shapes.append(shape)
+        return shapes
+
+    def _set_points(self, frame=None):
+        w, h = self._w, self._h
+        points = [Point(-w / 2, -h / 2, 0.0), Point(w / 2, -h / 2, 0.0), Point(w / 2, h / 2, 0.0), Point(-w / 2, h / 2, 0.0)]
+        if frame is None:
+            return points
+        # the outline is centred on the origin of the local frame
+        X = Transformation.from_frame_to_frame(Frame.worldXY(), frame)
+        return [point.transformed(X) for point in points]
+
+    def _compute_section_props(self):
+        w, h = self._w, self._h
+        return _section_props(w * h, 0.0, 0.0, w * h**3 / 12, h * w**3 / 12, 0.0)
+
 
 class Rhombus(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, a, b):
         self.__name__ = "Rhombus"
         self._a = a
@@ -283,6 +526,8 @@ class Rhombus(Shape):
 
 
 class UShape(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, a, b, t1, t2, t3, direction="up"):
         self.__name__ = "U-shape_" + direction
         self._a = a
@@ -291,17 +536,7 @@ class UShape(Shape):
         self._t2 = t2
         self._t3 = t3
         self._direction = direction
-        points = [
-            Point(-a / 2, -b / 2, 0.0),
-            Point(a / 2, -b / 2, 0.0),
-            Point(a / 2, b / 2, 0.0),
-            Point(a / 2 - t3, b / 2, 0.0),
-            Point(a / 2 - t3, t2 - b / 2, 0.0),
-            Point(t1 - a / 2, t2 - b / 2, 0.0),
-            Point(t1 - a / 2, b / 2, 0.0),
-            Point(-a / 2, b / 2, 0.0),
-        ]
-        super().__init__(points)
+        super().__init__(self._set_points())
 
     @property
     def a(self):
@@ -328,10 +563,24 @@ class UShape(Shape):
     def t3(self):
         return self._t3
 
+    def _set_points(self):
+        a, b, t1, t2, t3 = self._a, self._b, self._t1, self._t2, self._t3
+        return [
+            Point(-a / 2, -b / 2, 0.0),
+            Point(a / 2, -b / 2, 0.0),
+            Point(a / 2, b / 2, 0.0),
+            Point(a / 2 - t3, b / 2, 0.0),
+            Point(a / 2 - t3, t2 - b / 2, 0.0),
+            Point(t1 - a / 2, t2 - b / 2, 0.0),
+            Point(t1 - a / 2, b / 2, 0.0),
+            Point(-a / 2, b / 2, 0.0),
+        ]
+
 
 class TShape(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, a, b, t1, t2, direction="up"):
-        super(Shape, self).__init__()
         self._a = a
         self._b = b
         self._t1 = t1
@@ -368,6 +617,8 @@ class TShape(Shape):
 
 
 class IShape(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, w, h, tw, tbf, ttf, direction="up"):
         self._w = w
         self._h = h
@@ -381,14 +632,14 @@ class IShape(Shape):
             Point(w/2, -h/2, 0.0),
             Point(w/2, -h/2+tbf, 0.0),
             Point(tw/2, -h/2+tbf, 0.0),
-            Point(tw/2, h/2-tbf, 0.0),
-            Point(w/2, h/2-tbf, 0.0),
+            Point(tw/2, h/2-ttf, 0.0),
+            Point(w/2, h/2-ttf, 0.0),
             Point(w/2, h/2, 0.0),
             Point(-w/2, h/2, 0.0),
             Point(-w/2, h/2-ttf, 0.0),
             Point(-tw/2, h/2-ttf, 0.0),
-            Point(-tw/2, -h/2+ttf, 0.0),
-            Point(-w/2, -h/2+ttf, 0.0)
+            Point(-tw/2, -h/2+tbf, 0.0),
+            Point(-w/2, -h/2+tbf, 0.0)
         ]
         super().__init__(points)
 
@@ -416,8 +667,21 @@ class IShape(Shape):
     def J(self):
         return (1/3) * (self.w * (self.tbf**3 + self.ttf**3) + (self.h - self.tbf - self.ttf) * self.tw**3)
 
+    def _compute_section_props(self):
+        # bottom flange, top flange and web, composed with the parallel axis theorem
+        w, h, tw, tbf, ttf = self._w, self._h, self._tw, self._tbf, self._ttf
+        hw = h - tbf - ttf
+        parts = ((w, tbf, -h / 2 + tbf / 2), (w, ttf, h / 2 - ttf / 2), (tw, hw, (tbf - ttf) / 2))
+        A = sum(b * d for b, d, _ in parts)
+        cy = sum(b * d * y for b, d, y in parts) / A
+        Ixx = sum(b * d**3 / 12 + b * d * (y - cy) ** 2 for b, d, y in parts)
+        Iyy = sum(d * b**3 / 12 for b, d, _ in parts)
+        return _section_props(A, 0.0, cy, Ixx, Iyy, 0.0)
+
 
 class LShape(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, a, b, t1, t2, direction="up"):
         self._a = a
         self._b = b
@@ -453,8 +717,9 @@ class LShape(Shape):
 
 
 class CShape(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, height, flange_width, web_thickness, flange_thickness):
-        super().__init__()
         self._height = height
         self._flange_width = flange_width
         self._web_thickness = web_thickness
@@ -477,6 +742,8 @@ class CShape(Shape):
 
 
 class CustomI(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, height, top_flange_width, bottom_flange_width, web_thickness, top_flange_thickness, bottom_flange_thickness):
         self._height = height
         self._top_flange_width = top_flange_width
@@ -484,7 +751,6 @@ class CustomI(Shape):
         self._web_thickness = web_thickness
         self._top_flange_thickness = top_flange_thickness
         self._bottom_flange_thickness = bottom_flange_thickness
-        self._points = self._set_points()
 
         htf = self._top_flange_width / 2
         hbf = self._bottom_flange_width / 2
@@ -510,18 +776,19 @@ class CustomI(Shape):
 
 
 class Star(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(
         self,
         a,
         b,
         c,
     ):
-        super(Shape, self).__init__()
         self._a = a
         self._b = b
         self._c = c
         self._type = "Star"
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     @property
     def a(self):
@@ -546,14 +813,10 @@ class Star(Shape):
         return self._c
 
     @c.setter
-    def t(self, c):
+    def c(self, c):
         self._c = c
         self.points = self._set_points()
 
-    @property
-    def points(self):
-        return self._points
-
     def _set_points(self):
         return [
             Point(0.0, 0.0, 0.0),
@@ -568,11 +831,12 @@ class Star(Shape):
 
 
 class Circle(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, radius, segments=32):
-        super().__init__()
         self._radius = radius
         self._segments = segments
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     @property
     def radius(self):
@@ -581,19 +845,25 @@ class Circle(Shape):
     @radius.setter
     def radius(self, radius):
         self._radius = radius
-        self._points = self._set_points()
+        self.points = self._set_points()
 
     def _set_points(self):
-        return [Point(self._radius * np.cos(theta), self._radius * np.sin(theta), 0.0) for theta in np.linspace(0, 2 * np.pi, self._segments, endpoint=False)]
+        return _regular_polygon_points(self._segments, self._radius)
+
+    def _compute_section_props(self):
+        r = self._radius
+        inertia = pi * r**4 / 4
+        return _section_props(pi * r**2, 0.0, 0.0, inertia, inertia, 0.0)
 
 
 class Ellipse(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, radius_a, radius_b, segments=32):
-        super().__init__()
         self._radius_a = radius_a
         self._radius_b = radius_b
         self._segments = segments
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     @property
     def radius_a(self):
@@ -602,7 +872,7 @@ class Ellipse(Shape):
     @radius_a.setter
     def radius_a(self, radius_a):
         self._radius_a = radius_a
-        self._points = self._set_points()
+        self.points = self._set_points()
 
     @property
     def radius_b(self):
@@ -611,17 +881,22 @@ class Ellipse(Shape):
     @radius_b.setter
     def radius_b(self, radius_b):
         self._radius_b = radius_b
-        self._points = self._set_points()
+        self.points = self._set_points()
 
     def _set_points(self):
-        return [Point(self._radius_a * np.cos(theta), self._radius_b * np.sin(theta), 0.0) for theta in np.linspace(0, 2 * np.pi, self._segments, endpoint=False)]
+        return _regular_polygon_points(self._segments, self._radius_a, self._radius_b)
+
+    def _compute_section_props(self):
+        a, b = self._radius_a, self._radius_b
+        return _section_props(pi * a * b, 0.0, 0.0, pi * a * b**3 / 4, pi * b * a**3 / 4, 0.0)
 
 
 class Hexagon(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, side_length):
-        super().__init__()
         self._side_length = side_length
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     @property
     def side_length(self):
@@ -630,52 +905,66 @@ class Hexagon(Shape):
     @side_length.setter
     def side_length(self, side_length):
         self._side_length = side_length
-        self._points = self._set_points()
+        self.points = self._set_points()
 
     def _set_points(self):
-        return [Point(self._side_length * np.cos(np.pi / 3 * i), self._side_length * np.sin(np.pi / 3 * i), 0.0) for i in range(6)]
+        # the circumradius of a regular hexagon is equal to its side length
+        return _regular_polygon_points(6, self._side_length)
+
+    def _compute_section_props(self):
+        return _regular_polygon_props(6, self._side_length)
 
 
 class Pentagon(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, circumradius):
-        super().__init__()
         self._circumradius = circumradius
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     def _set_points(self):
-        angle = 2 * np.pi / 5  # 360 degrees / 5
-        return [Point(self._circumradius * np.cos(i * angle), self._circumradius * np.sin(i * angle), 0.0) for i in range(5)]
+        return _regular_polygon_points(5, self._circumradius)
+
+    def _compute_section_props(self):
+        return _regular_polygon_props(5, self._circumradius)
 
 
 class Octagon(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, circumradius):
-        super().__init__()
         self._circumradius = circumradius
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     def _set_points(self):
-        angle = 2 * np.pi / 8  # 360 degrees / 8
-        return [Point(self._circumradius * np.cos(i * angle), self._circumradius * np.sin(i * angle), 0.0) for i in range(8)]
+        return _regular_polygon_points(8, self._circumradius)
+
+    def _compute_section_props(self):
+        return _regular_polygon_props(8, self._circumradius)
 
 
 class Triangle(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, circumradius):
-        super().__init__()
         self._circumradius = circumradius
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     def _set_points(self):
-        angle = 2 * np.pi / 3  # 360 degrees / 3
-        return [Point(self._circumradius * np.cos(i * angle), self._circumradius * np.sin(i * angle), 0.0) for i in range(3)]
+        return _regular_polygon_points(3, self._circumradius)
+
+    def _compute_section_props(self):
+        return _regular_polygon_props(3, self._circumradius)
 
 
 class Parallelogram(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, width, height, angle):
-        super().__init__()
         self._width = width
         self._height = height
         self._angle = angle  # Angle in radians between the base and the adjacent side
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     def _set_points(self):
         dx = self._height * np.sin(self._angle)
@@ -684,12 +973,13 @@ class Parallelogram(Shape):
 
 
 class Trapezoid(Shape):
+    _points_are_planar_by_construction = True
+
     def __init__(self, top_width, bottom_width, height):
-        super().__init__()
         self._top_width = top_width
         self._bottom_width = bottom_width
         self._height = height
-        self._points = self._set_points()
+        super().__init__(self._set_points())
 
     def _set_points(self):
         dx = (self._bottom_width - self._top_width) / 2
@@ -2,44 +2,66 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from .problem import Problem
-from .displacements import GeneralDisplacement
-from .loads import (
-    Load,
-    PrestressLoad,
-    NodeLoad,
-    EdgeLoad,
-    FaceLoad,
-    GravityLoad,
-    TributaryLoad,
-    HarmonicPointLoad,
-    HarmonicPressureLoad,
-    ThermalLoad,
-)
-from .fields import (
-    _PrescribedField,
-    PrescribedTemperatureField,
-)
+import importlib
+import pkgutil
 
-from .patterns import Pattern, NodeLoadPattern, PointLoadPattern, LineLoadPattern, AreaLoadPattern, VolumeLoadPattern
+# public name -> submodule defining it; imported on first access (PEP 562)
+_LAZY = {
+    "Problem": ".problem",
+    "GeneralDisplacement": ".displacements",
+    "Load": ".loads",
+    "PrestressLoad": ".loads",
+    "NodeLoad": ".loads",
+    "EdgeLoad": ".loads",
+    "FaceLoad": ".loads",
+    "GravityLoad": ".loads",
+    "TributaryLoad": ".loads",
+    "HarmonicPointLoad": ".loads",
+    "HarmonicPressureLoad": ".loads",
+    "ThermalLoad": ".loads",
+    "_PrescribedField": ".fields",
+    "PrescribedTemperatureField": ".fields",
+    "Pattern": ".patterns",
+    "NodeLoadPattern": ".patterns",
+    "PointLoadPattern": ".patterns",
+    "LineLoadPattern": ".patterns",
+    "AreaLoadPattern": ".patterns",
+    "VolumeLoadPattern": ".patterns",
+    "LoadCombination": ".combinations",
+    "Step": ".steps",
+    "GeneralStep": ".steps",
+    "_Perturbation": ".steps",
+    "ModalAnalysis": ".steps",
+    "ComplexEigenValue": ".steps",
+    "StaticStep": ".steps",
+    "LinearStaticPerturbation": ".steps",
+    "BucklingAnalysis": ".steps",
+    "DynamicStep": ".steps",
+    "QuasiStaticStep": ".steps",
+    "DirectCyclicStep": ".steps",
+    "FieldOutput": ".outputs",
+    "HistoryOutput": ".outputs",
+}
 
-from .combinations import LoadCombination
 
-from .steps import (
-    Step,
-    GeneralStep,
-    _Perturbation,
-    ModalAnalysis,
-    ComplexEigenValue,
-    StaticStep,
-    LinearStaticPerturbation,
-    BucklingAnalysis,
-    DynamicStep,
-    QuasiStaticStep,
-    DirectCyclicStep,
-)
+# submodules and subpackages, also imported on first access
+_SUBMODULES = frozenset(module.name for module in pkgutil.iter_modules(__path__))
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        # importing binds the submodule as an attribute of the package
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
 
-from .outputs import FieldOutput, HistoryOutput
 
 __all__ = [
     "Problem",
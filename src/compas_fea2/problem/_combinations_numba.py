@@ -0,0 +1,35 @@
+"""Optional Numba kernels for :mod:`compas_fea2.problem.combinations`.
+
+If Numba is not installed, ``scatter_add`` is ``None`` and the combinations
+fall back to the NumPy implementation.
+"""
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _scatter_add(acc, index, values, factor):
+    """Add ``factor * values[i]`` to the row ``index[i]`` of ``acc``, in place.
+
+    Parameters
+    ----------
+    acc : numpy.ndarray
+        (n_nodes, 6) accumulator.
+    index : numpy.ndarray
+        (n,) row of each entry in the accumulator.
+    values : numpy.ndarray
+        (n, 6) unfactored load components.
+    factor : float
+        Load case factor.
+
+    """
+    for i in range(index.shape[0]):
+        row = index[i]
+        for k in range(acc.shape[1]):
+            acc[row, k] += factor * values[i, k]
+
+
+# the plain Python loop above is what gets compiled, so it can be tested without Numba
+scatter_add = numba.njit(cache=True)(_scatter_add) if numba is not None else None
@@ -2,7 +2,43 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import sys
+from types import MappingProxyType
+
+import numpy as np
+
 from compas_fea2.base import FEAData
+from compas_fea2.problem._combinations_numba import scatter_add as _scatter_add_jit
+from compas_fea2.problem.loads import NodeLoad
+
+_COMPONENTS = ("x", "y", "z", "xx", "yy", "zz")
+
+
+def _factor_tables(factors):
+    """Case -> position map, and factor, non-zero and unity arrays of a
+    normalised factors dict."""
+    factors_arr = np.array(list(factors.values()), dtype=np.float64)
+    active = factors_arr != 0.0
+    identity = factors_arr == 1.0
+    for array in (factors_arr, active, identity):
+        array.flags.writeable = False
+    case_index = {case: i for i, case in enumerate(factors)}
+    return case_index, factors_arr, active, identity
+
+
+# factors of the predefined combinations by name, with their tables computed once
+_DEAD_CASES = ("DL", "SDL")
+_PRESETS = {
+    name: (factors, _factor_tables(factors))
+    for name, factors in (
+        ("ULS", dict.fromkeys(_DEAD_CASES + ("LL",), 1.35)),
+        ("SLS", dict.fromkeys(_DEAD_CASES + ("LL",), 1.0)),
+        ("Fire", dict(dict.fromkeys(_DEAD_CASES, 1.0), LL=0.3)),
+    )
+}
+
+_NO_TOTALS = np.zeros((0, 6))
+_NO_TOTALS.flags.writeable = False
 
 
 class LoadCombination(FEAData):
@@ -15,16 +51,41 @@ class LoadCombination(FEAData):
     name : str, optional
         Name to assign to the combination,  by default None (automatically assigned).
 
+    Notes
+    -----
+    The factors are copied and frozen when they are assigned: to change them,
+    assign a new dictionary to :attr:`factors`.
+
     """
 
-    def __init__(self, factors, name=None, **kwargs):
+    def __init__(self, factors, name=None, _tables=None, **kwargs):
         super(LoadCombination, self).__init__(name, **kwargs)
-        self.factors = factors
+        if _tables is not None:
+            # predefined factors: already normalised, indexed and never mutated
+            self._set_factors(factors, _tables)
+        else:
+            self.factors = factors
+
+    @property
+    def factors(self):
+        return MappingProxyType(self._factors)
+
+    @factors.setter
+    def factors(self, factors):
+        self._set_factors({sys.intern(case) if isinstance(case, str) else case: float(factor) for case, factor in factors.items()})
+
+    def _set_factors(self, factors, tables=None):
+        self._factors = factors
+        # parallel index/array views of the factors used by node_load
+        self._case_index, self._factors_arr, self._active, self._identity = tables or _factor_tables(factors)
 
     @property
     def load_cases(self):
-        for k in self.factors.keys():
-            yield k
+        return self.factors.keys()
+
+    @property
+    def load_factors(self):
+        return self.factors.values()
 
     @property
     def step(self):
@@ -36,19 +97,24 @@ class LoadCombination(FEAData):
 
     @property
     def model(self):
-        self.problem._registration
+        return self.problem._registration
+
+    @classmethod
+    def _preset(cls, name):
+        factors, tables = _PRESETS[name]
+        return cls(factors=factors, name=name, _tables=tables)
 
     @classmethod
     def ULS(cls):
-        return cls(factors={"DL": 1.35, "SDL": 1.35, "LL": 1.35}, name="ULS")
+        return cls._preset("ULS")
 
     @classmethod
     def SLS(cls):
-        return cls(factors={"DL": 1, "SDL": 1, "LL": 1}, name="SLS")
+        return cls._preset("SLS")
 
     @classmethod
     def Fire(cls):
-        return cls(factors={"DL": 1, "SDL": 1, "LL": 0.3}, name="Fire")
+        return cls._preset("Fire")
 
     @property
     def node_load(self):
@@ -60,12 +126,149 @@ class LoadCombination(FEAData):
         zip obj
             :class:`compas_fea2.model.node.Node`, :class:`compas_fea2.problem.loads.NodeLoad`
         """
-        nodes_loads = {}
+        nodes, rows, totals = self._combined_totals()
+        return zip([nodes[i] for i in rows], [NodeLoad(**dict(zip(_COMPONENTS, totals[i].tolist()))) for i in rows])
+
+    def assemble_rhs(self, model=None, out=None):
+        """Assemble the combined nodal loads into a global load vector.
+
+        Parameters
+        ----------
+        model : :class:`compas_fea2.model.Model`, optional
+            The model defining the node numbering, by default the model of the
+            combination.
+        out : numpy.ndarray, optional
+            Contiguous vector of size ``6 * n_nodes`` to which the loads are
+            added in place, e.g. to accumulate several combinations without
+            temporary vectors. By default a new zero vector is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Vector of size ``6 * n_nodes`` with the x, y, z, xx, yy, zz
+            components of the load of each node, with the nodes sorted by
+            their input key.
+
+        Raises
+        ------
+        ValueError
+            If `out` does not have the size of the load vector of the model.
+        """
+        model = model or self.model
+        position = {node: i for i, node in enumerate(sorted(model.nodes, key=lambda node: node.input_key))}
+        if out is None:
+            out = np.zeros(6 * len(position))
+        elif out.shape != (6 * len(position),) or not out.flags.c_contiguous:
+            raise ValueError("out must be a contiguous vector of size {}".format(6 * len(position)))
+        nodes, rows, totals = self._combined_totals()
+        # each node appears once in rows, so the fancy-indexed add is exact
+        out.reshape(-1, 6)[[position[nodes[i]] for i in rows]] += totals[rows]
+        return out
+
+    def _combined_totals(self):
+        """Factored load of each loaded node.
+
+        The patterns are read again at every call, so the result always
+        reflects their current loads and distributions.
+
+        Returns
+        -------
+        tuple
+            The list of loaded nodes, the rows of the nodes actually loaded by
+            the combination and the (n_nodes, 6) array of their total loads.
+        """
+        if not self._factors:
+            # no load case is combined: nothing to collect from the step
+            return [], [], _NO_TOTALS
+        return self._compute_totals(*self._aggregator())
+
+    def _compute_totals(self, nodes, blocks):
+        factors = self._factors_arr
+        # cases with a zero factor still count as loaded, but are never scaled
+        active = self._active
+        identity = self._identity
+        n = len(nodes)
+        # with only zero factors the NumPy path just collects the loaded rows
+        if _scatter_add_jit is not None and active.any():
+            totals = np.zeros((n, 6))
+            loaded = np.zeros(n, dtype=bool)
+            for case, index, values in blocks:
+                if case >= 0:
+                    if active[case]:
+                        _scatter_add_jit(totals, index, values, factors[case])
+                    loaded[index] = True
+            return nodes, np.flatnonzero(loaded).tolist(), totals
+
+        loaded = []
+        indices = []
+        weights = []
+        for case, index, values in blocks:
+            if case < 0:
+                continue
+            loaded.append(index)
+            if not active[case]:
+                continue
+            indices.append(index)
+            weights.append(values if identity[case] else values * factors[case])
+        if not loaded:
+            return nodes, [], np.zeros((n, 6))
+        rows = np.flatnonzero(np.bincount(np.concatenate(loaded), minlength=n)).tolist()
+        if not indices:
+            return nodes, rows, np.zeros((n, 6))
+        index = np.concatenate(indices)
+        values = np.concatenate(weights)
+        # dense (n_nodes, 6) accumulator, summed per component with bincount
+        totals = np.stack([np.bincount(index, weights=values[:, i], minlength=n) for i in range(6)], axis=1)
+        return nodes, rows, totals
+
+    def iter_factored_node_loads(self):
+        """Iterate over the factored loads of the patterns of the step.
+
+        Patterns usually apply the same load object to all their nodes, so
+        each load is scaled once and the factored copy is shared by those
+        nodes instead of being re-created node by node.
+
+        Yields
+        ------
+        tuple
+            :class:`compas_fea2.problem.patterns.Pattern`, :class:`compas_fea2.model.node.Node`,
+            :class:`compas_fea2.problem.loads.NodeLoad`
+        """
+        factor_of = self._factors.get
+        for pattern in self.step.patterns:
+            factor = factor_of(pattern.load_case)
+            if factor is None:
+                continue
+            # keyed on the load itself, which also keeps it alive: an id() could
+            # be reused by a load created later if the pattern makes one per node
+            scaled = {}
+            for node, load in pattern.node_load:
+                factored_load = scaled.get(load)
+                if factored_load is None:
+                    factored_load = scaled[load] = factor * load
+                yield pattern, node, factored_load
+
+    def _aggregator(self):
+        """Unfactored node loads of the patterns of the step, one (n, 6) block
+        per pattern, with the row of each entry in the list of loaded nodes.
+
+        Returns
+        -------
+        tuple
+            The list of loaded nodes and a list of ``(case, index, values)``
+            blocks, where ``case`` is the position of the load case of the
+            pattern in the factors, or -1 if the combination does not use it.
+        """
+        case_of = self._case_index.get
+        rows = {}
+        row = rows.setdefault
+        blocks = []
         for pattern in self.step.patterns:
-            if pattern.load_case in self.factors:
-                for node, load in pattern.node_load:
-                    if node in nodes_loads:
-                        nodes_loads[node] += load * self.factors[pattern.load_case]
-                    else:
-                        nodes_loads[node] = load * self.factors[pattern.load_case]
-        return zip(list(nodes_loads.keys()), list(nodes_loads.values()))
+            node_loads = list(pattern.node_load)
+            # patterns usually share one load object among all their nodes
+            loads = {id(load): load for _, load in node_loads}
+            components = {key: [load.x or 0.0, load.y or 0.0, load.z or 0.0, load.xx or 0.0, load.yy or 0.0, load.zz or 0.0] for key, load in loads.items()}
+            index = [row(node, len(rows)) for node, _ in node_loads]
+            values = [components[id(load)] for _, load in node_loads]
+            blocks.append((case_of(pattern.load_case, -1), np.asarray(index, dtype=np.int64), np.asarray(values, dtype=np.float64).reshape(-1, 6)))
+        return list(rows), blocks
@@ -74,4 +74,4 @@ class GeneralDisplacement(FEAData):
 
     @property
     def components(self):
-        return {c: getattr(self, c) for c in ["x", "y", "z", "xx", "yy", "zz"]}
+        return {"x": self.x, "y": self.y, "z": self.z, "xx": self.xx, "yy": self.yy, "zz": self.zz}
@@ -3,7 +3,9 @@ from __future__ import division
 from __future__ import print_function
 
 import itertools
-from typing import Iterable
+import sys
+
+import numpy as np
 
 from compas_fea2.base import FEAData
 from compas_fea2.problem.loads import NodeLoad
@@ -53,7 +55,7 @@ class Pattern(FEAData):
         **kwargs,
     ):
         super(Pattern, self).__init__(name, **kwargs)
-        self._distribution = distribution if isinstance(distribution, Iterable) else [distribution]
+        self._distribution = distribution if hasattr(distribution, "__iter__") else [distribution]
         self._nodes = None
         self.x = x
         self.y = y
@@ -61,7 +63,8 @@ class Pattern(FEAData):
         self.xx = xx
         self.yy = yy
         self.zz = zz
-        self.load_case = load_case
+        # interned, so that factor lookups by load case compare by identity
+        self.load_case = sys.intern(load_case) if isinstance(load_case, str) else load_case
         self.axes = axes
         if axes != "global":
             raise NotImplementedError("local axes are not supported yet")
@@ -106,9 +109,8 @@ class NodeLoadPattern(Pattern):
 
     @property
     def node_load(self):
-        n_nodes = len(self.nodes)
         # FIXME change to tributary load for each node
-        return zip(self.nodes, [NodeLoad(**{k: v if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)] * n_nodes)
+        return zip(self.nodes, itertools.repeat(NodeLoad(**{k: v if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)))
 
 
 class PointLoadPattern(NodeLoadPattern):
@@ -123,6 +125,8 @@ class PointLoadPattern(NodeLoadPattern):
     def __init__(self, points, x=None, y=None, z=None, xx=None, yy=None, zz=None, load_case=None, axes="global", name=None, tolerance=1, **kwargs):
         super(PointLoadPattern, self).__init__(points, x, y, z, xx, yy, zz, load_case, axes, name, **kwargs)
         self.tolerance = tolerance
+        # contiguous (n_points, 3) coordinates, passed as is to the closest-node query
+        self._xyz = np.array(points, dtype=float).reshape(-1, 3)
 
     @property
     def points(self):
@@ -130,7 +134,11 @@ class PointLoadPattern(NodeLoadPattern):
 
     @property
     def nodes(self):
-        return [self.model.find_closest_nodes_to_point(point, distance=self.tolerance)[0] for point in self.points]
+        nodes = self.model.find_closest_nodes_to_points(self._xyz, distance=self.tolerance)
+        for xyz, node in zip(self._xyz.tolist(), nodes):
+            if node is None:
+                raise ValueError("No node found within {} from {}.".format(self.tolerance, xyz))
+        return nodes
 
 
 class LineLoadPattern(Pattern):
@@ -157,10 +165,12 @@ class LineLoadPattern(Pattern):
 
     @property
     def node_load(self):
-        n_nodes = len(self.nodes)
+        # the nodes are looked up in the model, so only once
+        nodes = self.nodes
+        n_nodes = len(nodes)
         length = self.polyline.length
         # FIXME change to tributary load for each node
-        return zip(self.nodes, [NodeLoad(**{k: v * length / n_nodes if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)] * n_nodes)
+        return zip(nodes, itertools.repeat(NodeLoad(**{k: v * length / n_nodes if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)))
 
 
 class AreaLoadPattern(Pattern):
@@ -186,9 +196,10 @@ class AreaLoadPattern(Pattern):
 
     @property
     def node_load(self):
-        n_nodes = len(self.nodes)
+        nodes = self.nodes
+        n_nodes = len(nodes)
         area = self.polygon.area
-        return zip(self.nodes, [NodeLoad(**{k: v * area / n_nodes if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)] * n_nodes)
+        return zip(nodes, itertools.repeat(NodeLoad(**{k: v * area / n_nodes if v else v for k, v in self.components.items()}, name=self.name, axes=self.axes)))
 
 
 class VolumeLoadPattern(Pattern):
@@ -225,4 +236,4 @@ class VolumeLoadPattern(Pattern):
                         nodes_loads[node] += load
                     else:
                         nodes_loads[node] = load
-        return zip(list(nodes_loads.keys()), list(nodes_loads.values()))
+        return zip(nodes_loads.keys(), nodes_loads.values())
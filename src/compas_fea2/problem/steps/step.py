@@ -97,23 +97,25 @@ class Step(FEAData):
         ------
         ValueError
             _description_
+
+        Notes
+        -----
+        The factored loads stored in ``node.loads[step][combination][pattern]``
+        are shared by all the nodes that receive the same load from a pattern:
+        treat them as read-only. Each node gets its own ``total_load``.
         """
         combination._registration = self
         self._combination = combination
         # for case in combination.load_cases:
         #     if case not in self._load_cases:
         #         raise ValueError(f"{case} is not a valid load case.")
-        for pattern in self.patterns:
-            if pattern.load_case in combination.load_cases:
-                factor = combination.factors[pattern.load_case]
-                for node, load in pattern.node_load:
-                    factored_load = factor * load
-
-                    node.loads.setdefault(self, {}).setdefault(combination, {})[pattern] = factored_load
-                    if node.total_load:
-                        node.total_load += factored_load
-                    else:
-                        node.total_load = factored_load
+        for pattern, node, factored_load in combination.iter_factored_node_loads():
+            node.loads.setdefault(self, {}).setdefault(combination, {})[pattern] = factored_load
+            if node.total_load:
+                node.total_load += factored_load
+            else:
+                # own copy, as the factored load may be shared with other nodes
+                node.total_load = factored_load * 1.0
 
     @property
     def history_outputs(self):
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from compas_fea2.model import DeformablePart
+from compas_fea2.model import Model
+from compas_fea2.model import Node
+from compas_fea2.problem import LoadCombination
+from compas_fea2.problem import NodeLoadPattern
+from compas_fea2.problem import Problem
+from compas_fea2.problem import StaticStep
+from compas_fea2.problem import _combinations_numba
+from compas_fea2.problem import combinations
+
+KERNELS = [_combinations_numba._scatter_add]
+if _combinations_numba.scatter_add is not None:
+    KERNELS.append(_combinations_numba.scatter_add)
+
+
+@pytest.fixture
+def step():
+    model = Model()
+    part = model.add_part(DeformablePart())
+    nodes = [part.add_node(Node([i, 0, 0])) for i in range(5)]
+    step = model.add_problem(Problem()).add_step(StaticStep())
+    step.add_load_pattern(NodeLoadPattern(nodes[:3], z=-10, load_case="DL"))
+    step.add_load_pattern(NodeLoadPattern(nodes[2:], x=2, z=-1, load_case="LL"))
+    step.add_load_pattern(NodeLoadPattern(nodes[4:], y=7, xx=0.5, load_case="WIND"))
+    step.add_load_pattern(NodeLoadPattern(nodes[1:2], z=-3, load_case="SDL"))
+    return step
+
+
+def combination_on(step, factors):
+    combination = LoadCombination(factors)
+    combination._registration = step
+    return combination
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("factors", [{"DL": 1.35, "LL": 1.5, "WIND": 0.9}, {"DL": 1.0, "SDL": 2.0}, {"DL": 0.0, "LL": 1.0}])
+def test_scatter_add_matches_bincount(monkeypatch, step, kernel, factors):
+    combination = combination_on(step, factors)
+    monkeypatch.setattr(combinations, "_scatter_add_jit", None)
+    expected = combination.assemble_rhs()
+    monkeypatch.setattr(combinations, "_scatter_add_jit", kernel)
+    assert np.allclose(combination.assemble_rhs(), expected)
+
+
+def reference_node_load(step, factors):
+    # plain dict accumulation of the factored components of each node
+    totals = {}
+    for pattern in step.patterns:
+        if pattern.load_case not in factors:
+            continue
+        factor = factors[pattern.load_case]
+        for node, load in pattern.node_load:
+            total = totals.setdefault(node, [0.0] * 6)
+            for i, value in enumerate(load.components.values()):
+                total[i] += (value or 0.0) * factor
+    return totals
+
+
+def as_dict(node_load):
+    return {node: [value or 0.0 for value in load.components.values()] for node, load in node_load}
+
+
+@pytest.mark.parametrize(
+    "combination",
+    [LoadCombination.ULS, LoadCombination.Fire, lambda: LoadCombination({"DL": 0.0, "LL": 0.0}), lambda: LoadCombination({})],
+    ids=["ULS", "Fire", "zero", "empty"],
+)
+def test_node_load_matches_reference(step, combination):
+    combination = combination()
+    combination._registration = step
+    expected = reference_node_load(step, combination.factors)
+    result = as_dict(combination.node_load)
+    assert result.keys() == expected.keys()
+    for node, components in expected.items():
+        assert result[node] == pytest.approx(components)
+
+
+def test_assemble_rhs_adds_to_out(step):
+    uls = combination_on(step, {"DL": 1.35, "LL": 1.5})
+    wind = combination_on(step, {"WIND": 1.0})
+    out = uls.assemble_rhs()
+    assert wind.assemble_rhs(out=out) is out
+    assert np.allclose(out, uls.assemble_rhs() + wind.assemble_rhs())
+    with pytest.raises(ValueError):
+        uls.assemble_rhs(out=np.zeros(6))
@@ -0,0 +1,43 @@
+import pytest
+from compas.geometry import Point
+
+from compas_fea2.model import DeformablePart
+from compas_fea2.model import Model
+from compas_fea2.model import Node
+from compas_fea2.problem import PointLoadPattern
+from compas_fea2.problem import Problem
+from compas_fea2.problem import StaticStep
+
+
+@pytest.fixture
+def part():
+    return DeformablePart()
+
+
+@pytest.fixture
+def model(part):
+    model = Model()
+    model.add_part(part)
+    for i in range(4):
+        for j in range(3):
+            part.add_node(Node([i, j, 0]))
+    model.add_part(DeformablePart()).add_node(Node([10, 10, 0]))
+    return model
+
+
+def test_find_closest_nodes_to_points(model, part):
+    nodes = part.find_closest_nodes_to_points([Point(1.1, 0.9, 0), [2.6, 2.2, 0.1], [50, 0, 0]], distance=1)
+    assert nodes[0].xyz == [1, 1, 0]
+    assert nodes[1].xyz == [3, 2, 0]
+    assert nodes[2] is None
+    nodes = model.find_closest_nodes_to_points([[9.5, 9.7, 0], [0.2, 0.1, 0]], distance=1)
+    assert [node.xyz for node in nodes] == [[10, 10, 0], [0, 0, 0]]
+
+
+def test_point_load_pattern_nodes(model):
+    step = model.add_problem(Problem()).add_step(StaticStep())
+    pattern = step.add_load_pattern(PointLoadPattern([[9.5, 9.7, 0], [3, 1, 0]], z=-1))
+    assert [node.xyz for node in pattern.nodes] == [[10, 10, 0], [3, 1, 0]]
+    pattern = step.add_load_pattern(PointLoadPattern([[90, 9.7, 0]], z=-1))
+    with pytest.raises(ValueError):
+        pattern.nodes
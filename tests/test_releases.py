@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from compas_fea2.model import BeamElement
+from compas_fea2.model import BeamEndPinRelease
+from compas_fea2.model import DeformablePart
+from compas_fea2.model import Node
+from compas_fea2.model import RectangularSection
+from compas_fea2.model import Steel
+from compas_fea2.model.releases import _BeamEndRelease
+
+
+@pytest.fixture
+def beams():
+    section = RectangularSection(w=0.1, h=0.2, material=Steel.S355())
+    nodes = [Node([i, 0, 0]) for i in range(3)]
+    return [BeamElement([a, b], section, frame=[0, 0, 1]) for a, b in zip(nodes, nodes[1:])]
+
+
+def test_get_shares_equivalent_releases():
+    release = _BeamEndRelease.get(m1=True)
+    assert release is _BeamEndRelease.get(False, False, False, True)
+    assert release is _BeamEndRelease.get(m1=1, t=False)
+    assert release is not _BeamEndRelease.get(m2=True)
+    assert BeamEndPinRelease.get(m1=True) is not release
+    with pytest.raises(TypeError):
+        _BeamEndRelease.get(True, m1=True, n=True)
+
+
+def test_releases_arrays(beams):
+    part = DeformablePart()
+    for beam in beams:
+        part.add_element(beam)
+    shared = _BeamEndRelease.get(m1=True, t=True)
+    part.add_beam_release(beams[0], "start", shared)
+    part.add_beam_release(beams[1], "end", shared)
+    part.add_beam_release(beams[1], "start", _BeamEndRelease(n=True))
+    arrays = part.releases_arrays
+    assert arrays["flags"].tolist() == [shared.flags, shared.flags, _BeamEndRelease(n=True).flags]
+    assert arrays["location"].tolist() == [0, 1, 0]
+    assert arrays["element"].tolist() == [beams[0].key, beams[1].key, beams[1].key]
+    assert arrays["element"].dtype == np.int64
+
+
+def test_releases_arrays_checks_membership(beams):
+    part = DeformablePart()
+    part.add_element(beams[0])
+    part.add_beam_release(beams[1], "end", _BeamEndRelease.get(m1=True))
+    with pytest.raises(ValueError):
+        part.releases_arrays
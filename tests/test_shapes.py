@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.tolerance import TOL
+
+from compas_fea2.model import _shapes_numba
+from compas_fea2.model.shapes import IShape
+from compas_fea2.model.shapes import Hexagon
+from compas_fea2.model.shapes import Octagon
+from compas_fea2.model.shapes import Pentagon
+from compas_fea2.model.shapes import Rectangle
+from compas_fea2.model.shapes import Shape
+from compas_fea2.model.shapes import Triangle
+from compas_fea2.model.shapes import _are_coplanar
+from compas_fea2.model.shapes import _shoelace_props
+
+KERNELS = [_shapes_numba._shoelace_props]
+if _shapes_numba.shoelace_props is not None:
+    KERNELS.append(_shapes_numba.shoelace_props)
+
+
+def star_polygon(n, seed):
+    """Simple polygon with `n` vertices at random radii around the origin."""
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+    radii = rng.uniform(0.5, 2.0, n)
+    return np.cos(angles) * radii + 0.3, np.sin(angles) * radii - 0.7
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("n", [3, 4, 5, 6, 8, 12, 33])
+@pytest.mark.parametrize("clockwise", [False, True])
+def test_shoelace_kernels_match_numpy(kernel, n, clockwise):
+    x, y = star_polygon(n, seed=n)
+    if clockwise:
+        x, y = x[::-1].copy(), y[::-1].copy()
+    expected = _shoelace_props(np.append(x, x[0]), np.append(y, y[0]))
+    assert np.allclose(kernel(x, y), expected, rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [
+        Rectangle(2.0, 4.0),
+        IShape(2.0, 4.0, 0.2, 0.3, 0.25),
+        Triangle(1.5),
+        Pentagon(1.5),
+        Hexagon(1.0),
+        Octagon(1.5),
+    ],
+    ids=lambda shape: type(shape).__name__,
+)
+def test_closed_form_properties_match_shoelace(shape):
+    closed_form = shape._compute_section_props()
+    generic = Shape._compute_section_props(shape)
+    for key, value in generic.items():
+        assert closed_form[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+def test_irregular_polygon_properties():
+    # L-shape made of a 3x1 and a 1x2 rectangle
+    shape = Shape([Point(0, 0, 0), Point(3, 0, 0), Point(3, 1, 0), Point(1, 1, 0), Point(1, 3, 0), Point(0, 3, 0)])
+    assert shape.area == pytest.approx(5.0)
+    assert list(shape.centroid) == pytest.approx([1.1, 1.1, 0.0])
+    assert shape.Ixy == pytest.approx(-1.8)
+
+
+def test_setitem_resets_cached_properties():
+    shape = Shape([Point(0, 0, 0), Point(2, 0, 0), Point(2, 1, 0), Point(0, 1, 0)])
+    assert shape.area == pytest.approx(2.0)
+    shape[0] = [-1, 0, 0]
+    assert shape.area == pytest.approx(2.5)
+
+
+def test_points_setter_resets_frame_and_properties():
+    shape = Shape([Point(0, 0, 0), Point(2, 0, 0), Point(2, 2, 0), Point(0, 2, 0)])
+    assert list(shape.centroid) == pytest.approx([1.0, 1.0, 0.0])
+    shape.points = [Point(0, 0, 0), Point(4, 0, 0), Point(4, 2, 0), Point(0, 2, 0)]
+    assert shape.area == pytest.approx(8.0)
+    assert list(shape.centroid) == pytest.approx([2.0, 1.0, 0.0])
+    shape.points = [Point(0, 0, 0), Point(4, 0, 0), Point(4, 2, 1), Point(0, 2, 0)]
+    with pytest.raises(ValueError):
+        shape.area
+
+
+def test_rectangle_from_arrays_checks_lengths():
+    with pytest.raises(ValueError):
+        Rectangle.from_arrays([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        Rectangle.from_arrays([1.0, 2.0], [1.0, 2.0], frames=[None])
+
+
+def test_rectangle_torsion_constant():
+    # the approximation is within 0.2% of the exact 0.1406 a^4 of a square
+    assert Rectangle(2.0, 2.0).J == pytest.approx(0.1406 * 2.0**4, rel=2e-3)
+    assert Rectangle(0.1, 0.3).J == pytest.approx(Rectangle(0.3, 0.1).J)
+
+
+def test_rectangle_from_arrays_matches_constructor():
+    frames = [None, Frame([1, 2, 3], [0, 1, 0], [0, 0, 1])]
+    shapes = Rectangle.from_arrays([0.1, 0.4], [0.3, 0.2], frames=frames)
+    for shape, w, h, frame in zip(shapes, [0.1, 0.4], [0.3, 0.2], frames):
+        rectangle = Rectangle(w, h, frame=frame)
+        assert shape.J == pytest.approx(rectangle.J)
+        assert shape.Avx == pytest.approx(rectangle.Avx)
+        for key, value in rectangle._compute_section_props().items():
+            assert shape._section_props[key] == pytest.approx(value, abs=1e-12), key
+        assert np.allclose(shape.points, rectangle.points)
+
+
+def test_coplanarity_uses_global_tolerance():
+    points = [Point(0, 0, 0), Point(1, 0, 0), Point(1, 1, 0.1 * TOL.absolute), Point(0, 1, 0)]
+    assert _are_coplanar(points)
+    points[2] = Point(1, 1, 10 * TOL.relative)
+    assert not _are_coplanar(points)